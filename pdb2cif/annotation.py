@@ -8,10 +8,15 @@ import logging
 import textwrap
 from collections import OrderedDict
 from datetime import datetime, date
-import pandas as pd
-
-from pandas.core.frame import DataFrame
-from .general import BaseRecord, grouper, date_parse, date_format, cif_df
+from .general import (
+    BaseRecord,
+    grouper,
+    date_parse,
+    date_format,
+    cif_df,
+    cif_rows,
+    non_missing_rows,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,7 +50,7 @@ class Author(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         for author in line[10:79].split(","):
             self.author_list.append(author.strip())
 
@@ -132,7 +137,7 @@ class Caveat(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[11:15].strip()
         self.comment.append(line[19:70].strip())
 
@@ -194,26 +199,25 @@ class Compound(BaseRecord):
             )
         else:
             df = entity_df
-        for _, row in df.iterrows():
+        for row in non_missing_rows(df):
             value_added = True
-            row = row.dropna()
             value = row["id"]
             self.compound += [f"MOL_ID: {value};"]
             value = row["pdbx_description"]
             self.compound += [f"MOLECULE:  {value}"]
-            if "pdbx_fragment" in row.index:
+            if "pdbx_fragment" in row:
                 value = row["pdbx_fragment"]
                 self.compound += [f"FRAGMENT:  {value}"]
-            if "name" in row.index:
+            if "name" in row:
                 value = row["name"]
                 self.compound += [f"SYNONYM:  {value}"]
-            if "pdbx_ec" in row.index:
+            if "pdbx_ec" in row:
                 value = row["pdbx_ec"]
                 self.compound += [f"EC:  {value}"]
-            if "pdbx_mutation" in row.index:
+            if "pdbx_mutation" in row:
                 value = row["pdbx_mutation"]
                 self.compound += [f"MUTATION:  {value}"]
-            if "details" in row.index:
+            if "details" in row:
                 value = row["details"]
                 self.compound += [f"OTHER_DETAILS:  {value}"]
         return value_added
@@ -223,7 +227,7 @@ class Compound(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.compound.append(line[10:80].strip())
 
     def __str__(self):
@@ -290,7 +294,7 @@ class ExperimentalData(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.technique.append(line[10:79].strip())
 
     def __str__(self):
@@ -338,7 +342,7 @@ class Header(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.classification = line[10:50].strip()
         self.dep_date = date_parse(line[50:59].strip())
         self.id_code = line[62:66].strip()
@@ -502,7 +506,7 @@ class Journal(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.text.append(line[12:79].strip())
 
     def __str__(self):
@@ -556,7 +560,7 @@ class Keywords(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.keywords.append(line[10:80].strip())
 
     def __str__(self):
@@ -615,7 +619,7 @@ class ModelType(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.comment.append(line[10:80].strip())
 
     def __str__(self):
@@ -720,7 +724,7 @@ class Obsolete(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.replace_date = date_parse(line[11:20].strip())
         self.id_code = line[21:25].strip()
         self.replace_id_codes = [line[31:35].strip()]
@@ -750,8 +754,7 @@ class Obsolete(BaseRecord):
                 f" {date_format(self.replace_date):9} {self.id_code}     "
             )
             for code in chunk:
-                if code is not None:
-                    string += f" {code:4}"
+                string += f" {code:4}"
             strings.append(string)
         return "\n".join(strings)
 
@@ -790,8 +793,8 @@ class Remark(BaseRecord):
 
         :param str line:  line with PDB class
         """
-        super().parse_pdb(line)
-        self.remark_num = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.remark_num = int(line[7:10])
         self.remark_text = line[11:79]
 
     def __str__(self):
@@ -848,8 +851,8 @@ class Revision(BaseRecord):
 
         :param str line:  line to parse.
         """
-        super().parse_pdb(line)
-        self.modification_num = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.modification_num = int(line[7:10])
         try:
             self.modification_date = date_parse(line[13:22].strip())
         except ValueError:
@@ -886,8 +889,7 @@ class Revision(BaseRecord):
                     f"      "
                 )
             for record in chunk:
-                if record is not None:
-                    string += f" {record:6}"
+                string += f" {record:6}"
             strings.append(string.strip())
         return "\n".join(strings)
 
@@ -957,12 +959,12 @@ class RevisionData(BaseRecord):
         :returns:  True if useful information was extracted from container
         """
         value_added = False
-        df = cif_df(container.get_object("pdbx_audit_revision_history"))
-        for _, row in df.iterrows():
+        for rev_num, rev_date in cif_rows(
+            container.get_object("pdbx_audit_revision_history"),
+            ("ordinal", "revision_date"),
+        ):
             revision = Revision()
-            rev_num = row["ordinal"]
             revision.modification_num = rev_num
-            rev_date = row["revision_date"]
             rev_date = datetime.strptime(rev_date, r"%Y-%m-%d")
             revision.modification_date = date(
                 year=rev_date.year, month=rev_date.month, day=rev_date.day
@@ -978,8 +980,8 @@ class RevisionData(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        mod_num = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        mod_num = int(line[7:10])
         revision = self._revisions.get(mod_num, Revision())
         revision.parse_pdb(line)
         self._revisions[mod_num] = revision
@@ -1081,16 +1083,16 @@ class SpecificSite(BaseException):
     def parse_cif_row(self, row):
         """Parse a row from a CIF file.
 
-        :param :class:`pandas.Series` row:  CIF row to parse
+        :param tuple row:  CIF row to parse, as a named tuple from
+            :meth:`pandas.DataFrame.itertuples`
         """
-        self.site_id = row["site_id"]
-        id_ = row["id"]
-        self.seq_num = id_
-        self.num_res = row["pdbx_num_res"]
-        self.res_name.append(row["auth_comp_id"])
-        self.chain_id.append(row["auth_asym_id"])
-        self.seq.append(row["auth_seq_id"])
-        self.ins_code.append(row["pdbx_auth_ins_code"])
+        self.site_id = row.site_id
+        self.seq_num = row.id
+        self.num_res = row.pdbx_num_res
+        self.res_name.append(row.auth_comp_id)
+        self.chain_id.append(row.auth_asym_id)
+        self.seq.append(row.auth_seq_id)
+        self.ins_code.append(row.pdbx_auth_ins_code)
 
     def __str__(self):
         strings = []
@@ -1189,8 +1191,8 @@ class Site(BaseRecord):
         """
         value_add = False
         df = cif_df(container.get_object("struct_site_gen")).fillna("")
-        for _, row in df.iterrows():
-            site_id = row["site_id"]
+        for row in df.itertuples(index=False):
+            site_id = row.site_id
             site = self.sites.get(site_id, SpecificSite())
             site.parse_cif_row(row)
             self.sites[site_id] = site
@@ -1202,33 +1204,33 @@ class Site(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         NotImplementedError()
-        self.seq_num = int(line[7:10].strip())
+        self.seq_num = int(line[7:10])
         self.site_id = line[11:14].strip()
-        self.num_res = int(line[15:17].strip())
+        self.num_res = int(line[15:17])
         self.res_name1 = line[18:21].strip()
         self.chain_id1 = line[22].strip()
-        self.seq1 = int(line[23:27].strip())
+        self.seq1 = int(line[23:27])
         try:
             self.ins_code1 = line[27].strip()
             self.res_name2 = line[29:32].strip()
             self.chain_id2 = line[33].strip()
-            self.seq2 = int(line[34:38].strip())
+            self.seq2 = int(line[34:38])
         except (IndexError, ValueError):
             pass
         try:
             self.ins_code2 = line[38].strip()
             self.res_name3 = line[40:43].strip()
             self.chain_id3 = line[44].strip()
-            self.seq3 = int(line[45:49].strip())
+            self.seq3 = int(line[45:49])
         except (IndexError, ValueError):
             pass
         try:
             self.ins_code3 = line[49].strip()
             self.res_name4 = line[51:54].strip()
             self.chain_id4 = line[55].strip()
-            self.seq4 = int(line[56:60].strip())
+            self.seq4 = int(line[56:60])
             self.ins_code4 = line[60].strip()
         except (IndexError, ValueError):
             pass
@@ -1263,7 +1265,7 @@ class NumModels(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.model_number = int(line[10:14])
 
     def __str__(self):
@@ -1325,8 +1327,7 @@ class Source(BaseRecord):
             df = df.merge(pdbx_entity_src_syn_df, how="outer", on="entity_id")
         except KeyError:
             pass
-        for _, row in df.iterrows():
-            row = row.dropna()
+        for row in non_missing_rows(df):
             for label, keys in {
                 "FRAGMENT": ["pdbx_fragment", "pdbx_gene_src_fragment"],
                 "ORGANISM_SCIENTIFIC": [
@@ -1381,7 +1382,7 @@ class Source(BaseRecord):
                 "EXPRESSION_SYSTEM_GENE": ["pdbx_host_org_gene"],
             }.items():
                 for key in keys:
-                    if key in row.index:
+                    if key in row:
                         self.source += [f"{label}: {row[key]}"]
                         value_added = True
         return value_added
@@ -1391,7 +1392,7 @@ class Source(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.continuation = line[7:10].strip()
         self.source.append(line[10:79].strip())
 
@@ -1481,8 +1482,7 @@ class Split(BaseRecord):
             else:
                 string += "SPLIT      "
             for code in chunk:
-                if code is not None:
-                    string += f" {code:4}"
+                string += f" {code:4}"
             strings += [string]
         return "\n".join(strings)
 
@@ -1571,7 +1571,7 @@ class Supersedes(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.super_date = date_parse(line[11:20].strip())
         self.id_code = line[21:25].strip()
         self.super_id_codes = [line[31:35].strip()]
@@ -1628,7 +1628,7 @@ class Title(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.title = " ".join([self.title, line[10:80].strip()])
 
     def __str__(self):
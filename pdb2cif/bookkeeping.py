@@ -48,14 +48,14 @@ class Connection(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         if line is None:
             line = ""
         istart = 6
         iend = 11
         while True:
             try:
-                self.serial.append(int(line[istart:iend].strip()))
+                self.serial.append(int(line[istart:iend]))
                 istart += 5
                 iend += 5
             except ValueError:
@@ -127,18 +127,18 @@ class Master(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.num_remark = int(line[10:15].strip())
-        self.num_het = int(line[20:25].strip())
-        self.num_helix = int(line[25:30].strip())
-        self.num_sheet = int(line[30:35].strip())
-        self.num_turn = int(line[35:40].strip())
-        self.num_site = int(line[40:45].strip())
-        self.num_xform = int(line[45:50].strip())
-        self.num_coord = int(line[50:55].strip())
-        self.num_ter = int(line[55:60].strip())
-        self.num_conect = int(line[60:65].strip())
-        self.num_seq = int(line[65:70].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.num_remark = int(line[10:15])
+        self.num_het = int(line[20:25])
+        self.num_helix = int(line[25:30])
+        self.num_sheet = int(line[30:35])
+        self.num_turn = int(line[35:40])
+        self.num_site = int(line[40:45])
+        self.num_xform = int(line[45:50])
+        self.num_coord = int(line[50:55])
+        self.num_ter = int(line[55:60])
+        self.num_conect = int(line[60:65])
+        self.num_seq = int(line[65:70])
 
     def __str__(self):
         return (
@@ -6,34 +6,58 @@
 """
 from itertools import count
 import logging
+from sys import intern
 from typing import OrderedDict
 from .general import BaseRecord, atom_format, cif_df
 
 _LOGGER = logging.getLogger(__name__)
+# Fixed column positions of the ATOM, HETATM, ANISOU, and TER record fields
+_SERIAL_SLC = slice(6, 11)
+_NAME_SLC = slice(12, 16)
+_ALT_LOC_IDX = 16
+_RES_NAME_SLC = slice(17, 20)
+_CHAIN_ID_IDX = 21
+_RES_SEQ_SLC = slice(22, 26)
+_INS_CODE_IDX = 26
+_X_SLC = slice(30, 38)
+_Y_SLC = slice(38, 46)
+_Z_SLC = slice(46, 54)
+_OCCUPANCY_SLC = slice(54, 60)
+_TEMP_FACTOR_SLC = slice(60, 66)
+_U00_SLC = slice(28, 35)
+_U11_SLC = slice(35, 42)
+_U22_SLC = slice(42, 49)
+_U01_SLC = slice(49, 56)
+_U02_SLC = slice(56, 63)
+_U12_SLC = slice(63, 70)
+_SEG_ID_SLC = slice(72, 76)
+_ELEMENT_SLC = slice(76, 78)
+_CHARGE_SLC = slice(78, 80)
 
 
 def atom_extract_cif(atom, row):
     """Extract atom information from CIF record.
 
     :param atom-like atom:  :class:`Atom` or :class`HeterogenAtom` object
-    :param pandas.Series row:  CIF row
+    :param tuple row:  CIF row, as a named tuple from
+        :meth:`pandas.DataFrame.itertuples`
     :returns:  :class:`Atom` or :class`HeterogenAtom` object with CIF information
     :rtype:  atom-like
     """
-    atom.serial = row["id"]
-    atom.name = row["auth_atom_id"]
-    atom.alt_loc = row["label_alt_id"]
-    atom.res_name = row["auth_comp_id"]
-    atom.chain_id = row["auth_asym_id"]
-    atom.res_seq = row["auth_seq_id"]
-    atom.ins_code = row["pdbx_PDB_ins_code"]
-    atom.x = float(row["Cartn_x"])
-    atom.y = float(row["Cartn_y"])
-    atom.z = float(row["Cartn_z"])
-    atom.occupancy = float(row["occupancy"])
-    atom.temp_factor = float(row["B_iso_or_equiv"])
-    atom.element = row["type_symbol"]
-    charge = row["pdbx_formal_charge"]
+    atom.serial = row.id
+    atom.name = intern(row.auth_atom_id)
+    atom.alt_loc = row.label_alt_id
+    atom.res_name = intern(row.auth_comp_id)
+    atom.chain_id = row.auth_asym_id
+    atom.res_seq = row.auth_seq_id
+    atom.ins_code = row.pdbx_PDB_ins_code
+    atom.x = float(row.Cartn_x)
+    atom.y = float(row.Cartn_y)
+    atom.z = float(row.Cartn_z)
+    atom.occupancy = float(row.occupancy)
+    atom.temp_factor = float(row.B_iso_or_equiv)
+    atom.element = row.type_symbol
+    charge = row.pdbx_formal_charge
     if charge:
         atom.charge = float(charge)
     return atom
@@ -55,10 +79,45 @@ class Model(BaseRecord):
     +---------+-------------+----------+--------------------------------------+
     """
 
+    __slots__ = (
+        "serial",
+        "records",
+        "_all_atoms",
+        "_atoms",
+        "_het_atoms",
+        "_ters",
+    )
+
     def __init__(self):
         super().__init__()
         self.serial = None
         self.records = []
+        # Records are also partitioned by type as they are added, so the atom
+        # accessors and counts do not have to filter every record each call
+        self._all_atoms = []
+        self._atoms = []
+        self._het_atoms = []
+        self._ters = []
+
+    def add_records(self, records):
+        """Add coordinate records to the model.
+
+        Use this (or :meth:`parse_pdb`) rather than modifying
+        :attr:`records` directly so that the per-type lists stay in sync.
+
+        :param list records:  :class:`Atom`, :class:`HeterogenAtom`,
+            :class:`TemperatureFactor`, or :class:`ChainTerminus` objects
+        """
+        self.records += records
+        for record in records:
+            if isinstance(record, Atom):
+                self._all_atoms.append(record)
+                self._atoms.append(record)
+            elif isinstance(record, HeterogenAtom):
+                self._all_atoms.append(record)
+                self._het_atoms.append(record)
+            elif isinstance(record, ChainTerminus):
+                self._ters.append(record)
 
     @staticmethod
     def parse_cif(container) -> list:
@@ -81,26 +140,63 @@ class Model(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        name = line[0:6].strip()
-        if name == "MODEL":
-            self.serial = int(line[10:14].strip())
-            return
-        if name == "ENDMDL":
-            return
-        if name == "ATOM":
-            record = Atom()
-        elif name == "ANISOU":
-            record = TemperatureFactor()
-        elif name == "TER":
-            record = ChainTerminus()
-        elif name == "HETATM":
-            record = HeterogenAtom()
-        else:
-            err = f"Unexpected line: {line}"
-            raise ValueError(err)
+        BaseRecord.parse_pdb(self, line)
+        handler = self._HANDLERS.get(line[0:6])
+        if handler is None:
+            # Short records such as a bare "TER" may not be padded to the
+            # full six-column record name
+            handler = self._HANDLERS.get(f"{line[0:6].strip():6}")
+            if handler is None:
+                err = f"Unexpected line: {line}"
+                raise ValueError(err)
+        handler(self, line)
+
+    def _parse_model(self, line):
+        """Parse a MODEL line."""
+        self.serial = int(line[10:14])
+
+    def _parse_endmdl(self, line):
+        """ENDMDL lines carry no data."""
+
+    def _parse_atom(self, line):
+        """Parse an ATOM line."""
+        record = Atom()
+        record.parse_pdb(line)
+        self.records.append(record)
+        self._all_atoms.append(record)
+        self._atoms.append(record)
+
+    def _parse_het_atom(self, line):
+        """Parse a HETATM line."""
+        record = HeterogenAtom()
+        record.parse_pdb(line)
+        self.records.append(record)
+        self._all_atoms.append(record)
+        self._het_atoms.append(record)
+
+    def _parse_temp_factor(self, line):
+        """Parse an ANISOU line."""
+        record = TemperatureFactor()
+        record.parse_pdb(line)
+        self.records.append(record)
+
+    def _parse_ter(self, line):
+        """Parse a TER line."""
+        record = ChainTerminus()
         record.parse_pdb(line)
         self.records.append(record)
+        self._ters.append(record)
+
+    # Parser for each record, keyed by the raw six-column record name so the
+    # common case needs neither a strip() nor a chain of string comparisons
+    _HANDLERS = {
+        "ATOM  ": _parse_atom,
+        "HETATM": _parse_het_atom,
+        "ANISOU": _parse_temp_factor,
+        "TER   ": _parse_ter,
+        "MODEL ": _parse_model,
+        "ENDMDL": _parse_endmdl,
+    }
 
     @property
     def all_atoms(self) -> list:
@@ -108,11 +204,7 @@ class Model(BaseRecord):
 
         :returns:  list of :class:`Atom`-like objects
         """
-        return [
-            rec
-            for rec in self.records
-            if isinstance(rec, (Atom, HeterogenAtom))
-        ]
+        return self._all_atoms
 
     @property
     def het_atoms(self) -> list:
@@ -120,7 +212,7 @@ class Model(BaseRecord):
 
         :returns:  list of :class:`Atom`-like objects
         """
-        return [rec for rec in self.records if isinstance(rec, HeterogenAtom)]
+        return self._het_atoms
 
     @property
     def atoms(self) -> list:
@@ -128,53 +220,45 @@ class Model(BaseRecord):
 
         :returns:  list of :class:`Atom`-like objects
         """
-        return [rec for rec in self.records if isinstance(rec, Atom)]
+        return self._atoms
 
     def num_atoms(self, heavy_only) -> int:
         """Number of ATOM and HETATM entries in all chains in model.
 
         :param bool heavy_only:  exclude hydrogen atoms from count
         """
-        num_atom = 0
-        for atom in self.all_atoms:
-            if (atom.element not in ["H", "D"]) or (not heavy_only):
-                num_atom += 1
-        return num_atom
+        atoms = self.all_atoms
+        if not heavy_only:
+            return len(atoms)
+        return sum(1 for atom in atoms if atom.element not in ("H", "D"))
 
     def num_chains(self) -> int:
         """Count number of chains in model."""
-        chains = set()
-        for atom in self.all_atoms:
-            chains.add(atom.chain_id)
-        return len(chains)
+        return len({atom.chain_id for atom in self.all_atoms})
 
     def num_residues(self, count_hetatm) -> int:
         """Number of residues in entry.
 
         :param bool count_hetatm:  include heterogen residues in count
         """
-        residues = set()
         if count_hetatm:
             atom_list = self.all_atoms
         else:
             atom_list = self.atoms
-        for atom in atom_list:
-            key = f"{atom.chain_id}{atom.res_name}{atom.res_seq}"
-            residues.add(key)
+        residues = {
+            (atom.chain_id, atom.res_name, atom.res_seq) for atom in atom_list
+        }
         return len(residues)
 
     def num_ter(self) -> int:
         """Count number of termini in entry."""
-        return len(
-            [rec for rec in self.records if isinstance(rec, ChainTerminus)]
-        )
+        return len(self._ters)
 
     def __str__(self):
         strings = []
         if self.serial:
             strings.append(f"MODEL     {self.serial:4}".strip())
-        for record in self.records:
-            strings.append(str(record))
+        strings.extend(map(str, self.records))
         return "\n".join(strings)
 
 
@@ -225,6 +309,24 @@ class Atom(BaseRecord):
     +---------+--------------+-------------+----------------------------------+
     """
 
+    __slots__ = (
+        "serial",
+        "name",
+        "alt_loc",
+        "res_name",
+        "chain_id",
+        "res_seq",
+        "ins_code",
+        "x",
+        "y",
+        "z",
+        "occupancy",
+        "temp_factor",
+        "seg_id",
+        "element",
+        "charge",
+    )
+
     def __init__(self):
         super().__init__()
         self.serial = None
@@ -254,10 +356,10 @@ class Atom(BaseRecord):
         atoms = {}
         df = cif_df(container.get_object("atom_site")).fillna("")
         df = df[df["group_PDB"] == "ATOM"]
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False):
             atom = Atom()
             atom = atom_extract_cif(atom, row)
-            model_num = row["pdbx_PDB_model_num"]
+            model_num = row.pdbx_PDB_model_num
             model = atoms.get(model_num, [])
             model.append(atom)
             atoms[model_num] = model
@@ -268,25 +370,27 @@ class Atom(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.serial = int(line[6:11].strip())
-        self.name = line[12:16].strip()
-        self.alt_loc = line[16].strip()
-        self.res_name = line[17:20].strip()
-        self.chain_id = line[21].strip()
-        self.res_seq = int(line[22:26].strip())
-        self.ins_code = line[26].strip()
-        self.x = float(line[30:38].strip())
-        self.y = float(line[38:46].strip())
-        self.z = float(line[46:54].strip())
-        try:
-            self.occupancy = float(line[54:60].strip())
-            self.temp_factor = float(line[60:66].strip())
-            self.seg_id = line[72:76].strip()
-            self.element = line[76:78].strip()
-            self.charge = line[78:80].strip()
-        except (ValueError, IndexError):
-            pass
+        BaseRecord.parse_pdb(self, line)
+        self.serial = int(line[_SERIAL_SLC])
+        self.name = intern(line[_NAME_SLC].strip())
+        self.alt_loc = line[_ALT_LOC_IDX].strip()
+        self.res_name = intern(line[_RES_NAME_SLC].strip())
+        self.chain_id = line[_CHAIN_ID_IDX].strip()
+        self.res_seq = int(line[_RES_SEQ_SLC])
+        self.ins_code = line[_INS_CODE_IDX].strip()
+        self.x = float(line[_X_SLC])
+        self.y = float(line[_Y_SLC])
+        self.z = float(line[_Z_SLC])
+        # Records may end after the coordinates
+        occupancy = line[_OCCUPANCY_SLC]
+        if occupancy.strip():
+            self.occupancy = float(occupancy)
+        temp_factor = line[_TEMP_FACTOR_SLC]
+        if temp_factor.strip():
+            self.temp_factor = float(temp_factor)
+        self.seg_id = line[_SEG_ID_SLC].strip()
+        self.element = line[_ELEMENT_SLC].strip()
+        self.charge = line[_CHARGE_SLC].strip()
 
     def __str__(self):
         return (
@@ -340,6 +444,25 @@ class TemperatureFactor(BaseRecord):
     +---------+--------------+----------+-------------------------------------+
     """
 
+    __slots__ = (
+        "serial",
+        "name",
+        "alt_loc",
+        "res_name",
+        "chain_id",
+        "res_seq",
+        "ins_code",
+        "u00",
+        "u11",
+        "u22",
+        "u01",
+        "u02",
+        "u12",
+        "seg_id",
+        "element",
+        "charge",
+    )
+
     def __init__(self):
         super().__init__()
         self.serial = None
@@ -369,23 +492,59 @@ class TemperatureFactor(BaseRecord):
         """
         factors = {}
         df = cif_df(container.get_object("atom_site_anisotrop"))
-        for _, row in df.iterrows():
+        # Columns such as "U[1][1]" are not valid identifiers, so read plain
+        # tuples by position rather than named tuples
+        columns = [
+            "id",
+            "pdbx_auth_atom_id",
+            "pdbx_label_alt_id",
+            "pdbx_auth_comp_id",
+            "pdbx_auth_asym_id",
+            "pdbx_auth_seq_id",
+            "pdbx_PDB_ins_code",
+            "U[1][1]",
+            "U[2][2]",
+            "U[3][3]",
+            "U[1][2]",
+            "U[1][3]",
+            "U[2][3]",
+            "type_symbol",
+            "pdbx_PDB_model_num",
+        ]
+        if df.empty:
+            return factors
+        for (
+            serial,
+            name,
+            alt_loc,
+            res_name,
+            chain_id,
+            res_seq,
+            ins_code,
+            u00,
+            u11,
+            u22,
+            u01,
+            u02,
+            u12,
+            element,
+            model_num,
+        ) in df[columns].itertuples(index=False, name=None):
             factor = TemperatureFactor()
-            factor.serial = row["id"]
-            factor.name = row["pdbx_auth_atom_id"]
-            factor.alt_loc = row["pdbx_label_alt_id"]
-            factor.res_name = row["pdbx_auth_comp_id"]
-            factor.chain_id = row["pdbx_auth_asym_id"]
-            factor.res_seq = row["pdbx_auth_seq_id"]
-            factor.ins_code = row["pdbx_PDB_ins_code"]
-            factor.u00 = float(row["U[1][1]"])
-            factor.u11 = float(row["U[2][2]"])
-            factor.u22 = float(row["U[3][3]"])
-            factor.u01 = float(row["U[1][2]"])
-            factor.u02 = float(row["U[1][3]"])
-            factor.u12 = float(row["U[2][3]"])
-            factor.element = row["type_symbol"]
-            model_num = row["pdbx_PDB_model_num"]
+            factor.serial = serial
+            factor.name = name
+            factor.alt_loc = alt_loc
+            factor.res_name = res_name
+            factor.chain_id = chain_id
+            factor.res_seq = res_seq
+            factor.ins_code = ins_code
+            factor.u00 = float(u00)
+            factor.u11 = float(u11)
+            factor.u22 = float(u22)
+            factor.u01 = float(u01)
+            factor.u02 = float(u02)
+            factor.u12 = float(u12)
+            factor.element = element
             model = factors.get(model_num, [])
             model.append(factor)
             factors[model_num] = model
@@ -396,23 +555,23 @@ class TemperatureFactor(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.serial = int(line[6:11].strip())
-        self.name = line[12:16].strip()
-        self.alt_loc = line[16].strip()
-        self.res_name = line[17:20].strip()
-        self.chain_id = line[21].strip()
-        self.res_seq = int(line[22:26].strip())
-        self.ins_code = line[26].strip()
-        self.u00 = float(line[28:35].strip())
-        self.u11 = float(line[35:42].strip())
-        self.u22 = float(line[42:49].strip())
-        self.u01 = float(line[49:56].strip())
-        self.u02 = float(line[56:63].strip())
-        self.u12 = float(line[63:70].strip())
-        self.seg_id = line[72:76].strip()
-        self.element = line[76:78].strip()
-        self.charge = line[78:80].strip()
+        BaseRecord.parse_pdb(self, line)
+        self.serial = int(line[_SERIAL_SLC])
+        self.name = intern(line[_NAME_SLC].strip())
+        self.alt_loc = line[_ALT_LOC_IDX].strip()
+        self.res_name = intern(line[_RES_NAME_SLC].strip())
+        self.chain_id = line[_CHAIN_ID_IDX].strip()
+        self.res_seq = int(line[_RES_SEQ_SLC])
+        self.ins_code = line[_INS_CODE_IDX].strip()
+        self.u00 = float(line[_U00_SLC])
+        self.u11 = float(line[_U11_SLC])
+        self.u22 = float(line[_U22_SLC])
+        self.u01 = float(line[_U01_SLC])
+        self.u02 = float(line[_U02_SLC])
+        self.u12 = float(line[_U12_SLC])
+        self.seg_id = line[_SEG_ID_SLC].strip()
+        self.element = line[_ELEMENT_SLC].strip()
+        self.charge = line[_CHARGE_SLC].strip()
 
     def __str__(self):
         return (
@@ -447,6 +606,14 @@ class ChainTerminus(BaseRecord):
     +---------+--------------+----------+-------------------------------------+
     """
 
+    __slots__ = (
+        "serial",
+        "res_name",
+        "chain_id",
+        "res_seq",
+        "ins_code",
+    )
+
     def __init__(self):
         super().__init__()
         self.serial = None
@@ -460,15 +627,15 @@ class ChainTerminus(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         if line is None:
             line = ""
         try:
-            self.serial = int(line[6:11].strip())
-            self.res_name = line[17:20].strip()
-            self.chain_id = line[21].strip()
-            self.res_seq = int(line[22:26].strip())
-            self.ins_code = line[26].strip()
+            self.serial = int(line[_SERIAL_SLC])
+            self.res_name = intern(line[_RES_NAME_SLC].strip())
+            self.chain_id = line[_CHAIN_ID_IDX].strip()
+            self.res_seq = int(line[_RES_SEQ_SLC])
+            self.ins_code = line[_INS_CODE_IDX].strip()
         except (IndexError, ValueError):
             pass
 
@@ -521,6 +688,24 @@ class HeterogenAtom(BaseRecord):
     +---------+--------------+-------------+----------------------------------+
     """
 
+    __slots__ = (
+        "serial",
+        "name",
+        "alt_loc",
+        "res_name",
+        "chain_id",
+        "res_seq",
+        "ins_code",
+        "x",
+        "y",
+        "z",
+        "occupancy",
+        "temp_factor",
+        "seg_id",
+        "element",
+        "charge",
+    )
+
     def __init__(self):
         super().__init__()
         self.serial = None
@@ -550,10 +735,10 @@ class HeterogenAtom(BaseRecord):
         atoms = {}
         df = cif_df(container.get_object("atom_site")).fillna("")
         df = df[df["group_PDB"] == "HETATM"]
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False):
             atom = HeterogenAtom()
             atom = atom_extract_cif(atom, row)
-            model_num = row["pdbx_PDB_model_num"]
+            model_num = row.pdbx_PDB_model_num
             model = atoms.get(model_num, [])
             model.append(atom)
             atoms[model_num] = model
@@ -564,28 +749,30 @@ class HeterogenAtom(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.serial = int(line[6:11].strip())
-        self.name = line[12:16].strip()
-        self.alt_loc = line[16].strip()
+        BaseRecord.parse_pdb(self, line)
+        self.serial = int(line[_SERIAL_SLC])
+        self.name = intern(line[_NAME_SLC].strip())
+        self.alt_loc = line[_ALT_LOC_IDX].strip()
         try:
-            self.res_name = line[17:20].strip()
-            self.chain_id = line[21].strip()
-            self.res_seq = int(line[22:26].strip())
-            self.ins_code = line[26].strip()
+            self.res_name = intern(line[_RES_NAME_SLC].strip())
+            self.chain_id = line[_CHAIN_ID_IDX].strip()
+            self.res_seq = int(line[_RES_SEQ_SLC])
+            self.ins_code = line[_INS_CODE_IDX].strip()
         except IndexError:
             raise ValueError("Residue name must be less than 4 characters!")
-        self.x = float(line[30:38].strip())
-        self.y = float(line[38:46].strip())
-        self.z = float(line[46:54].strip())
-        try:
-            self.occupancy = float(line[54:60].strip())
-            self.temp_factor = float(line[60:66].strip())
-            self.seg_id = line[72:76].strip()
-            self.element = line[76:78].strip()
-            self.charge = line[78:80].strip()
-        except (ValueError, IndexError):
-            pass
+        self.x = float(line[_X_SLC])
+        self.y = float(line[_Y_SLC])
+        self.z = float(line[_Z_SLC])
+        # Records may end after the coordinates
+        occupancy = line[_OCCUPANCY_SLC]
+        if occupancy.strip():
+            self.occupancy = float(occupancy)
+        temp_factor = line[_TEMP_FACTOR_SLC]
+        if temp_factor.strip():
+            self.temp_factor = float(temp_factor)
+        self.seg_id = line[_SEG_ID_SLC].strip()
+        self.element = line[_ELEMENT_SLC].strip()
+        self.charge = line[_CHARGE_SLC].strip()
 
     def __str__(self):
         return (
@@ -9,6 +9,16 @@ from .general import BaseRecord, cif_df
 
 
 _LOGGER = logging.getLogger(__name__)
+_FRACT_ALL_KEYS = [
+    key
+    for n in [1, 2, 3]
+    for key in [
+        f"fract_transf_matrix[{n}][1]",
+        f"fract_transf_matrix[{n}][2]",
+        f"fract_transf_matrix[{n}][3]",
+        f"fract_transf_vector[{n}]",
+    ]
+]
 
 
 class FractionalTransform(BaseRecord):
@@ -54,14 +64,14 @@ class FractionalTransform(BaseRecord):
             parse
         :returns:  list of objects of this class
         """
+        import numpy as np
+
         transforms = []
         df = cif_df(container.get_object("atom_sites"))
-        for n in [1, 2, 3]:
+        raw = np.array(df[_FRACT_ALL_KEYS].values[0], dtype=np.float64)
+        for n, row in enumerate(raw.reshape(3, 4).tolist(), start=1):
             transform = FractionalTransform(n)
-            transform.sn1 = float(df[f"fract_transf_matrix[{n}][1]"])
-            transform.sn2 = float(df[f"fract_transf_matrix[{n}][2]"])
-            transform.sn3 = float(df[f"fract_transf_matrix[{n}][3]"])
-            transform.unif = float(df[f"fract_transf_vector[{n}]"])
+            transform.sn1, transform.sn2, transform.sn3, transform.unif = row
             transforms.append(transform)
         return transforms
 
@@ -70,11 +80,11 @@ class FractionalTransform(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.sn1 = float(line[10:20].strip())
-        self.sn2 = float(line[20:30].strip())
-        self.sn3 = float(line[30:40].strip())
-        self.unif = float(line[45:55].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.sn1 = float(line[10:20])
+        self.sn2 = float(line[20:30])
+        self.sn3 = float(line[30:40])
+        self.unif = float(line[45:55])
 
     def __str__(self):
         return (
@@ -141,11 +151,11 @@ class OriginalTransform(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.on1 = float(line[10:20].strip())
-        self.on2 = float(line[20:30].strip())
-        self.on3 = float(line[30:40].strip())
-        self.tn = float(line[45:55].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.on1 = float(line[10:20])
+        self.on2 = float(line[20:30])
+        self.on3 = float(line[30:40])
+        self.tn = float(line[45:55])
 
     def __str__(self):
         return (
@@ -228,14 +238,14 @@ class NoncrystalTransform(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.serial = int(line[7:10].strip())
-        self.mn1 = float(line[10:20].strip())
-        self.mn2 = float(line[20:30].strip())
-        self.mn3 = float(line[30:40].strip())
-        self.vecn = float(line[45:55].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.serial = int(line[7:10])
+        self.mn1 = float(line[10:20])
+        self.mn2 = float(line[20:30])
+        self.mn3 = float(line[30:40])
+        self.vecn = float(line[45:55])
         try:
-            self.i_given = int(line[59].strip())
+            self.i_given = int(line[59])
         except (ValueError, IndexError):
             pass
 
@@ -311,16 +321,16 @@ class UnitCell(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.a = float(line[6:15].strip())
-        self.b = float(line[15:24].strip())
-        self.c = float(line[24:33].strip())
-        self.alpha = float(line[33:40].strip())
-        self.beta = float(line[40:47].strip())
-        self.gamma = float(line[47:54].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.a = float(line[6:15])
+        self.b = float(line[15:24])
+        self.c = float(line[24:33])
+        self.alpha = float(line[33:40])
+        self.beta = float(line[40:47])
+        self.gamma = float(line[47:54])
         self.space_group = line[55:65].strip()
         try:
-            self.z = int(line[66:70].strip())
+            self.z = int(line[66:70])
         except ValueError:
             pass
 
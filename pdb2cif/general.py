@@ -6,27 +6,35 @@
 """
 import logging
 from datetime import datetime
-from itertools import zip_longest
-from pandas import DataFrame
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 _LOGGER = logging.getLogger(__name__)
 DATE_FMT = r"%d-%b-%y"
 
 
-def grouper(iterable, block_size, fillvalue=None) -> list:
+def grouper(iterable, block_size, fillvalue=None) -> Iterator[tuple]:
     """Group an iterable into chunks of block_size.
 
-    Adapted from
-    https://docs.python.org/3/library/itertools.html#itertools-recipes.
+    The last chunk is shorter than block_size if the iterable does not
+    divide evenly, unless fillvalue is given.
 
     :param list iterable:  list to break into chunks
     :param int block_size:  chunk size
-    :param fillvalue:  fill in chunks without values
-    :returns:  list of chunks
+    :param fillvalue:  if not None, pad the last chunk with this value
+    :returns:  iterator over chunks
     """
-    args = [iter(iterable)] * block_size
-    return zip_longest(*args, fillvalue=fillvalue)
+    iterator = iter(iterable)
+    chunks = iter(lambda: tuple(islice(iterator, block_size)), ())
+    if fillvalue is None:
+        return chunks
+    return (
+        chunk + (fillvalue,) * (block_size - len(chunk)) for chunk in chunks
+    )
 
 
 def date_parse(date_string) -> datetime:
@@ -66,12 +74,18 @@ def atom_format(record) -> str:
     return f" {record.name:<3}"[:4]
 
 
-def cif_df(cif_object) -> DataFrame:
+def cif_df(cif_object) -> "DataFrame":
     """Convert a CIF object to a DataFrame.
 
+    pandas is imported here rather than at module level so that reading
+    PDB-format files does not pay its import cost; CIF parsers import numpy
+    locally for the same reason.
+
     :param :class:`pdbx.containers.DataCategory` cif_object:  object to convert
     :returns:  DataFrame with CIF object data
     """
+    from pandas import DataFrame
+
     if cif_object is None:
         return DataFrame()
     row_list = cif_object.row_list
@@ -79,9 +93,52 @@ def cif_df(cif_object) -> DataFrame:
     return DataFrame(data=row_list, columns=attr_list)
 
 
+def cif_rows(cif_object, columns) -> list:
+    """Get selected columns of a CIF object as row tuples.
+
+    Small categories that are read once do not need a DataFrame; this reads
+    the row list directly. Missing values are returned as empty strings, as
+    with ``cif_df(...).fillna("")``.
+
+    :param :class:`pdbx.containers.DataCategory` cif_object:  object to read
+    :param list columns:  names of the attributes to extract
+    :returns:  list of tuples with one value per requested column
+    :raises KeyError:  if a requested attribute is not in the object
+    """
+    if cif_object is None:
+        return []
+    attr_index = {attr: i for i, attr in enumerate(cif_object.attribute_list)}
+    indices = [attr_index[column] for column in columns]
+    return [
+        tuple("" if row[i] is None else row[i] for i in indices)
+        for row in cif_object.row_list
+    ]
+
+
+def non_missing_rows(df) -> Iterator[dict]:
+    """Iterate over DataFrame rows as dictionaries without missing values.
+
+    This is equivalent to ``row.dropna()`` for each row of
+    ``df.iterrows()`` without building a Series per row.
+
+    :param :class:`pandas.DataFrame` df:  DataFrame to iterate over
+    :returns:  iterator over dictionaries mapping column names to values,
+        omitting None and NaN values
+    """
+    columns = df.columns
+    for values in df.itertuples(index=False, name=None):
+        yield {
+            key: value
+            for key, value in zip(columns, values)
+            if value is not None and value == value
+        }
+
+
 class BaseRecord:
     """Base class for all PDB records."""
 
+    __slots__ = ("original_text",)
+
     def __init__(self):
         self.original_text = []
 
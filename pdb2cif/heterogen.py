@@ -5,11 +5,58 @@
 .. codeauthor::  Nathan Baker
 """
 import logging
-from collections import OrderedDict
 from .general import BaseRecord, cif_df
 
 
 _LOGGER = logging.getLogger(__name__)
+_AMINO_ACIDS = frozenset(
+    [
+        "ALA",
+        "ARG",
+        "ASN",
+        "ASP",
+        "CYS",
+        "GLN",
+        "GLU",
+        "GLY",
+        "HIS",
+        "ILE",
+        "LEU",
+        "LYS",
+        "MET",
+        "PHE",
+        "PRO",
+        "SER",
+        "THR",
+        "TRP",
+        "TYR",
+        "VAL",
+    ]
+)
+# chem_comp columns read by HeterogenSynonym and Formula
+_CHEM_COMP_COLUMNS = ("id", "pdbx_synonyms", "formula")
+# Fixed column positions of the HET record fields
+_HET_ID_SLC = slice(7, 10)
+_HET_CHAIN_IDX = 12
+_HET_SEQ_SLC = slice(13, 17)
+_HET_INS_IDX = 17
+_HET_NUM_SLC = slice(20, 25)
+_HET_TEXT_SLC = slice(30, 70)
+
+
+def _nonstandard_chem_comp(container):
+    """Get ``chem_comp`` rows for everything but the standard amino acids.
+
+    :param :class:`pdbx.containers.DataContainer` container:  container to
+        parse
+    :returns:  DataFrame with the filtered ``chem_comp`` rows, limited to the
+        columns that the heterogen records use
+    """
+    df = cif_df(container.get_object("chem_comp"))
+    if df.empty:
+        return df
+    columns = [col for col in _CHEM_COMP_COLUMNS if col in df.columns]
+    return df.loc[~df["id"].isin(_AMINO_ACIDS), columns]
 
 
 class Heterogen(BaseRecord):
@@ -49,6 +96,15 @@ class Heterogen(BaseRecord):
     +---------+-------------+---------------+---------------------------------+
     """
 
+    __slots__ = (
+        "hetatm_id",
+        "chain_id",
+        "seq_num",
+        "ins_code",
+        "num_het_atoms",
+        "text",
+    )
+
     def __init__(self):
         super().__init__()
         self.hetatm_id = None
@@ -67,28 +123,31 @@ class Heterogen(BaseRecord):
         :returns:  list of objects of this class
         """
         df = cif_df(container.get_object("pdbx_nonpoly_scheme"))
-        het_list = []
-        for _, row in df.iterrows():
-            het = Heterogen()
-            het.hetatm_id = row["pdb_mon_id"]
-            het.chain_id = row["pdb_strand_id"]
-            het.seq_num = row["pdb_seq_num"]
-            het.ins_code = row["pdb_ins_code"]
-            het_list.append(het)
-        return het_list
+        if df.empty:
+            return []
+        return [
+            _make_heterogen(mon_id, strand_id, seq_num, ins_code)
+            for mon_id, strand_id, seq_num, ins_code in zip(
+                df["pdb_mon_id"].to_numpy(),
+                df["pdb_strand_id"].to_numpy(),
+                df["pdb_seq_num"].to_numpy(),
+                df["pdb_ins_code"].to_numpy(),
+            )
+        ]
 
     def parse_pdb(self, line):
         """Parse PDB-format line.
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.hetatm_id = line[7:10].strip()
-        self.chain_id = line[12].strip()
-        self.seq_num = int(line[13:17].strip())
-        self.ins_code = line[17].strip()
-        self.num_het_atoms = int(line[20:25].strip())
-        self.text = line[30:70].strip()
+        BaseRecord.parse_pdb(self, line)
+        self.hetatm_id = line[_HET_ID_SLC].strip()
+        self.chain_id = line[_HET_CHAIN_IDX].strip()
+        # int() ignores surrounding whitespace
+        self.seq_num = int(line[_HET_SEQ_SLC])
+        self.ins_code = line[_HET_INS_IDX].strip()
+        self.num_het_atoms = int(line[_HET_NUM_SLC])
+        self.text = line[_HET_TEXT_SLC].strip()
 
     def __str__(self):
         return (
@@ -97,6 +156,23 @@ class Heterogen(BaseRecord):
         )
 
 
+def _make_heterogen(hetatm_id, chain_id, seq_num, ins_code) -> Heterogen:
+    """Build a :class:`Heterogen` from ``pdbx_nonpoly_scheme`` values.
+
+    :param str hetatm_id:  heterogen identifier
+    :param str chain_id:  chain identifier
+    :param str seq_num:  sequence number
+    :param str ins_code:  insertion code
+    :returns:  new heterogen record
+    """
+    het = Heterogen()
+    het.hetatm_id = hetatm_id
+    het.chain_id = chain_id
+    het.seq_num = seq_num
+    het.ins_code = ins_code
+    return het
+
+
 class HeterogenName(BaseRecord):
     """HETNAM field
 
@@ -118,9 +194,11 @@ class HeterogenName(BaseRecord):
     +---------+--------------+--------------+---------------------------------+
     """
 
+    __slots__ = ("heterogens",)
+
     def __init__(self):
         super().__init__()
-        self.heterogens = OrderedDict()
+        self.heterogens = {}
 
     def parse_cif(self, container) -> bool:
         """Parse CIF container for information about this record.
@@ -131,9 +209,12 @@ class HeterogenName(BaseRecord):
         """
         value_added = False
         df = cif_df(container.get_object("pdbx_entity_nonpoly"))
-        for _, row in df.iterrows():
-            het_id = row["comp_id"]
-            self.heterogens[het_id] = [row["name"]]
+        if df.empty:
+            return value_added
+        for het_id, name in df[["comp_id", "name"]].itertuples(
+            index=False, name=None
+        ):
+            self.heterogens[het_id] = [name]
             value_added = True
         return value_added
 
@@ -142,25 +223,19 @@ class HeterogenName(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         hetatm_id = line[11:14].strip()
         string = line[15:70].strip()
-        strings = self.heterogens.get(hetatm_id, [])
-        strings.append(string)
-        self.heterogens[hetatm_id] = strings
+        self.heterogens.setdefault(hetatm_id, []).append(string)
 
     def __str__(self):
         strings = []
         for hetatm, lines in self.heterogens.items():
-            for iline, line in enumerate(lines):
-                continuation = iline + 1
-                if continuation > 1:
-                    string = (
-                        f"HETNAM  {continuation:>2} {hetatm:>3}  {line:54}"
-                    )
-                else:
-                    string = f"HETNAM     {hetatm:>3} {line:55}"
-                strings.append(string)
+            strings.append(f"HETNAM     {hetatm:>3} {lines[0]:55}")
+            strings += [
+                f"HETNAM  {continuation:>2} {hetatm:>3}  {line:54}"
+                for continuation, line in enumerate(lines[1:], start=2)
+            ]
         return "\n".join(strings)
 
 
@@ -186,9 +261,11 @@ class HeterogenSynonym(BaseRecord):
     +----------+--------------+--------------+--------------------------------+
     """
 
+    __slots__ = ("synonyms",)
+
     def __init__(self):
         super().__init__()
-        self.synonyms = OrderedDict()
+        self.synonyms = {}
 
     def parse_cif(self, container) -> bool:
         """Parse CIF container for information about this record.
@@ -198,61 +275,31 @@ class HeterogenSynonym(BaseRecord):
         :returns:  True if useful information was extracted from container
         """
         value_added = False
-        df = cif_df(container.get_object("chem_comp"))
-        df = df[
-            ~df["id"].isin(
-                [
-                    "ALA",
-                    "ARG",
-                    "ASN",
-                    "ASP",
-                    "CYS",
-                    "GLN",
-                    "GLU",
-                    "GLY",
-                    "HIS",
-                    "HOH",
-                    "ILE",
-                    "LEU",
-                    "LYS",
-                    "MET",
-                    "PHE",
-                    "PRO",
-                    "SER",
-                    "THR",
-                    "TRP",
-                    "TYR",
-                    "VAL",
-                ]
-            )
-        ]
-        for _, row in df.iterrows():
-            het_id = row["id"]
-            name = row["pdbx_synonyms"]
+        df = _nonstandard_chem_comp(container)
+        if df.empty or "pdbx_synonyms" not in df.columns:
+            return value_added
+        df = df.loc[df["id"] != "HOH"]
+        for het_id, name in df[["id", "pdbx_synonyms"]].itertuples(
+            index=False, name=None
+        ):
             if name is not None:
-                syns = self.synonyms.get(het_id, [])
-                syns.append(name)
-                self.synonyms[het_id] = syns
+                self.synonyms.setdefault(het_id, []).append(name)
                 value_added = True
         return value_added
 
     def parse_pdb(self, line):
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         het_id = line[11:14].strip()
-        synonyms = self.synonyms.get(het_id, [])
-        synonyms.append(line[15:70].strip())
-        self.synonyms[het_id] = synonyms
+        self.synonyms.setdefault(het_id, []).append(line[15:70].strip())
 
     def __str__(self):
         lines = []
         for het_id, synonyms in self.synonyms.items():
-            for isyn, syn in enumerate(synonyms):
-                continuation = isyn + 1
-                if continuation > 1:
-                    line = f"HETSYN  {continuation:>2} {het_id:3}  {syn:54}"
-                else:
-                    line = f"HETSYN     {het_id:3} {syn:55}"
-                lines.append(line)
+            lines.append(f"HETSYN     {het_id:3} {synonyms[0]:55}")
+            lines += [
+                f"HETSYN  {continuation:>2} {het_id:3}  {syn:54}"
+                for continuation, syn in enumerate(synonyms[1:], start=2)
+            ]
         return "\n".join(lines)
 
 
@@ -279,9 +326,11 @@ class Formula(BaseRecord):
     +---------+-------------+--------------+----------------------------------+
     """
 
+    __slots__ = ("_components",)
+
     def __init__(self):
         super().__init__()
-        self._components = OrderedDict()
+        self._components = {}
 
     def parse_cif(self, container) -> bool:
         """Parse CIF container for information about this record.
@@ -291,36 +340,12 @@ class Formula(BaseRecord):
         :returns:  True if useful information was extracted from container
         """
         value_added = False
-        df = cif_df(container.get_object("chem_comp"))
-        df = df[
-            ~df["id"].isin(
-                [
-                    "ALA",
-                    "ARG",
-                    "ASN",
-                    "ASP",
-                    "CYS",
-                    "GLN",
-                    "GLU",
-                    "GLY",
-                    "HIS",
-                    "ILE",
-                    "LEU",
-                    "LYS",
-                    "MET",
-                    "PHE",
-                    "PRO",
-                    "SER",
-                    "THR",
-                    "TRP",
-                    "TYR",
-                    "VAL",
-                ]
-            )
-        ]
-        for _, row in df.iterrows():
-            het_id = row["id"]
-            formula = row["formula"]
+        df = _nonstandard_chem_comp(container)
+        if df.empty or "formula" not in df.columns:
+            return value_added
+        for het_id, formula in df[["id", "formula"]].itertuples(
+            index=False, name=None
+        ):
             self.components[het_id] = formula
             value_added = True
         return value_added
@@ -343,20 +368,14 @@ class Formula(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        component_num = int(line[8:10].strip())
-        if component_num not in self._components:
-            self._components[component_num] = []
-        hetatm_id = line[12:15].strip()
-        text = line[18:70].rstrip()
-        self._components[component_num].append((hetatm_id, text))
+        BaseRecord.parse_pdb(self, line)
+        self._components.setdefault(int(line[8:10]), []).append(
+            (line[12:15].strip(), line[18:70].rstrip())
+        )
 
     def __str__(self):
-        strings = []
-        for component_num, component_list in self._components.items():
-            for hetatm_id, text in component_list:
-                string = (
-                    f"FORMUL  {component_num:>2}  {hetatm_id:>3}   {text:52}"
-                ).strip()
-                strings.append(string)
-        return "\n".join(strings)
+        return "\n".join(
+            f"FORMUL  {component_num:>2}  {hetatm_id:>3}   {text}".rstrip()
+            for component_num, component_list in self._components.items()
+            for hetatm_id, text in component_list
+        )
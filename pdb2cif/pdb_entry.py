@@ -7,6 +7,7 @@ Contents Guide: Atomic Coordinate Entry Format Description, Version 3.3
 .. codeauthor::  Nathan Baker
 """
 import logging
+from itertools import chain
 from pdb2cif.general import cif_df
 import pdbx
 from . import annotation, primary, heterogen, secondary, coordinates
@@ -14,6 +15,26 @@ from . import crystallography, bookkeeping
 
 
 _LOGGER = logging.getLogger(__name__)
+# Records handled by the Model of the current entry
+_COORDINATE_RECORDS = frozenset(["ATOM", "HETATM", "ANISOU", "TER"])
+# Records that each become one object appended to an Entry list attribute,
+# mapped to the record class and the name of that attribute
+_LIST_RECORDS = {
+    "JRNL": (annotation.Journal, "_journal"),
+    "REMARK": (annotation.Remark, "_remark"),
+    "DBREF": (primary.DatabaseReference, "_database_reference"),
+    "DBREF1": (primary.DatabaseReference1, "_database_reference"),
+    "DBREF2": (primary.DatabaseReference2, "_database_reference"),
+    "SEQADV": (primary.SequenceDifferences, "_sequence_difference"),
+    "HET": (heterogen.Heterogen, "_heterogen"),
+    "HELIX": (secondary.Helix, "_helix"),
+    "SHEET": (secondary.Sheet, "_sheet"),
+    "SSBOND": (secondary.DisulfideBond, "_disulfide_bond"),
+    "LINK": (secondary.Link, "_link"),
+    "CISPEP": (secondary.CisPeptide, "_cis_peptide"),
+    "MODEL": (coordinates.Model, "_model"),
+    "CONECT": (bookkeeping.Connection, "_connect"),
+}
 REF_LINE = (
     "0        1         2         3         4         5         6         7         8\n"
     "12345678901234567890123456789012345678901234567890123456789012345678901234567890"
@@ -156,10 +177,11 @@ class Entry:
         if helices:
             self._helix = helices
         _LOGGER.warning("Not parsing SHEET records from CIF.")
-        disulfides = secondary.DisulfideBond.parse_cif(container)
+        struct_conn = secondary.struct_conn_table(container)
+        disulfides = secondary.DisulfideBond.parse_cif(container, struct_conn)
         if disulfides:
             self._disulfide_bond = disulfides
-        links = secondary.Link.parse_cif(container)
+        links = secondary.Link.parse_cif(container, struct_conn)
         if links:
             self._link = links
         cis_peps = secondary.CisPeptide.parse_cif(container)
@@ -189,15 +211,15 @@ class Entry:
         for model in models:
             model_num = model.serial
             try:
-                model.records += atoms[model_num]
+                model.add_records(atoms[model_num])
             except KeyError:
                 _LOGGER.debug(f"No ATOM records for model {model_num}.")
             try:
-                model.records += het_atoms[model_num]
+                model.add_records(het_atoms[model_num])
             except KeyError:
                 _LOGGER.debug(f"No HETATM records for model {model_num}.")
             try:
-                model.records += temp_factors[model_num]
+                model.add_records(temp_factors[model_num])
             except KeyError:
                 _LOGGER.debug(f"No ANISOU records for model {model_num}.")
         self._model = models
@@ -630,7 +652,7 @@ class Entry:
     def __str__(self):
         strings = []
         # Title section
-        for record in (
+        for record in chain(
             [
                 self._header,
                 self._obsolete,
@@ -644,20 +666,20 @@ class Entry:
                 self._num_model,
                 self._model_type,
                 self.author,
-            ]
-            + [self._revision_data]
-            + [self._supersedes]
-            + self._journal
-            + self._remark
+                self._revision_data,
+                self._supersedes,
+            ],
+            self._journal,
+            self._remark,
         ):
             if record is not None:
                 strings.append(str(record))
         # Primary structure section
-        for record in (
-            self._database_reference
-            + self._sequence_difference
-            + [self._sequence_residue]
-            + self._modified_residue
+        for record in chain(
+            self._database_reference,
+            self._sequence_difference,
+            [self._sequence_residue],
+            self._modified_residue,
         ):
             if record is not None:
                 strings.append(str(record))
@@ -674,29 +696,25 @@ class Entry:
             if record is not None:
                 strings.append(str(record))
         # Secondary structure section
-        for record in self._helix + self._sheet:
-            if record is not None:
-                strings.append(str(record))
+        # These lists only ever hold parsed records, so serialize them in bulk
+        strings.extend(map(str, self._helix))
+        strings.extend(map(str, self._sheet))
         # Connectivity annotation section
-        for record in self._disulfide_bond:
-            if record is not None:
-                strings.append(str(record))
+        strings.extend(map(str, self._disulfide_bond))
         for record in self._link:
             record = self.annotate_link(record)
             if record is not None:
                 strings.append(str(record))
-        for record in self._cis_peptide:
-            if record is not None:
-                strings.append(str(record))
+        strings.extend(map(str, self._cis_peptide))
         # Miscellaneous section
         if self._site is not None:
             strings.append(str(self._site))
         # Crystallographic and coordinate transformation section
-        for record in (
-            [self._unit_cell]
-            + self._orig_transform
-            + self._frac_transform
-            + self._noncrystal_transform
+        for record in chain(
+            [self._unit_cell],
+            self._orig_transform,
+            self._frac_transform,
+            self._noncrystal_transform,
         ):
             if record is not None:
                 strings.append(str(record))
@@ -707,9 +725,7 @@ class Entry:
                 if len(self._model) > 1:
                     strings.append("ENDMDL")
         # Connectivity section
-        for record in self._connect:
-            if record is not None:
-                strings.append(str(record))
+        strings.extend(map(str, self._connect))
         # Bookkeeping section
         if self._master is not None:
             strings.append(str(self._master))
@@ -734,7 +750,17 @@ class Entry:
         :param str line:  line of PDB file
         """
         name = line[0:6].strip()
-        if name == "HEADER":
+        # Coordinate records make up most of a file, so test for them first
+        if name in _COORDINATE_RECORDS:
+            if len(self._model) == 0:
+                self._model = [coordinates.Model()]
+            self._model[-1].parse_pdb(line)
+        elif name in _LIST_RECORDS:
+            record_class, attribute = _LIST_RECORDS[name]
+            record = record_class()
+            record.parse_pdb(line)
+            getattr(self, attribute).append(record)
+        elif name == "HEADER":
             if self._header:
                 err = f"HEADER already exists:\n{self._header}"
                 raise ValueError(err)
@@ -794,38 +820,10 @@ class Entry:
             if not self._supersedes:
                 self._supersedes = annotation.Supersedes()
             self._supersedes.parse_pdb(line)
-        elif name == "JRNL":
-            journal = annotation.Journal()
-            journal.parse_pdb(line)
-            self._journal.append(journal)
-        elif name == "REMARK":
-            remark = annotation.Remark()
-            remark.parse_pdb(line)
-            self._remark.append(remark)
-        elif name == "DBREF":
-            database = primary.DatabaseReference()
-            database.parse_pdb(line)
-            self._database_reference.append(database)
-        elif name == "DBREF1":
-            database = primary.DatabaseReference1()
-            database.parse_pdb(line)
-            self._database_reference.append(database)
-        elif name == "DBREF2":
-            database = primary.DatabaseReference2()
-            database.parse_pdb(line)
-            self._database_reference.append(database)
-        elif name == "SEQADV":
-            seqadv = primary.SequenceDifferences()
-            seqadv.parse_pdb(line)
-            self._sequence_difference.append(seqadv)
         elif name == "SEQRES":
             if not self._sequence_residue:
                 self._sequence_residue = primary.SequenceResidues()
             self._sequence_residue.parse_pdb(line)
-        elif name == "HET":
-            het = heterogen.Heterogen()
-            het.parse_pdb(line)
-            self._heterogen.append(het)
         elif name == "HETNAM":
             if not self._heterogen_name:
                 self._heterogen_name = heterogen.HeterogenName()
@@ -838,26 +836,6 @@ class Entry:
             if not self._heterogen_formula:
                 self._heterogen_formula = heterogen.Formula()
             self._heterogen_formula.parse_pdb(line)
-        elif name == "HELIX":
-            helix = secondary.Helix()
-            helix.parse_pdb(line)
-            self._helix.append(helix)
-        elif name == "SHEET":
-            sheet = secondary.Sheet()
-            sheet.parse_pdb(line)
-            self._sheet.append(sheet)
-        elif name == "SSBOND":
-            bond = secondary.DisulfideBond()
-            bond.parse_pdb(line)
-            self._disulfide_bond.append(bond)
-        elif name == "LINK":
-            link = secondary.Link()
-            link.parse_pdb(line)
-            self._link.append(link)
-        elif name == "CISPEP":
-            pep = secondary.CisPeptide()
-            pep.parse_pdb(line)
-            self._cis_peptide.append(pep)
         elif name == "SITE":
             site = annotation.Site()
             site.parse_pdb(line)
@@ -893,18 +871,6 @@ class Entry:
             if len(self._noncrystal_transform) > 3:
                 err = f"Too many ({len(self._noncrystal_transform)}) transforms."
                 raise ValueError(err)
-        elif name == "MODEL":
-            model = coordinates.Model()
-            model.parse_pdb(line)
-            self._model.append(model)
-        elif name in ["ATOM", "ANISOU", "TER", "HETATM"]:
-            if len(self._model) == 0:
-                self._model = [coordinates.Model()]
-            self._model[-1].parse_pdb(line)
-        elif name == "CONECT":
-            connect = bookkeeping.Connection()
-            connect.parse_pdb(line)
-            self._connect.append(connect)
         elif name == "MASTER":
             if self._master:
                 err = f"MASTER record already exists. Got: {line}."
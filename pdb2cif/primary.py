@@ -5,14 +5,33 @@
 .. codeauthor::  Nathan Baker
 """
 import logging
-from collections import OrderedDict
-import pandas as pd
-
-from pandas.core.algorithms import diff
+from sys import intern
 from .general import BaseRecord, grouper, cif_df
 
 
 _LOGGER = logging.getLogger(__name__)
+# Merged struct_ref/struct_ref_seq columns used for DBREF records, in the
+# order they are unpacked in DatabaseReference.parse_cif
+_DBREF_CIF_COLUMNS = [
+    "pdbx_PDB_id_code",
+    "pdbx_strand_id",
+    "seq_align_beg",
+    "pdbx_seq_align_beg_ins_code",
+    "seq_align_end",
+    "pdbx_seq_align_end_ins_code",
+    "db_name",
+    "pdbx_db_accession",
+    "db_code",
+    "db_align_beg",
+    "db_align_end",
+]
+# DBREF columns that may be absent from the CIF file
+_DBREF_OPTIONAL_COLUMNS = (
+    "pdbx_seq_align_beg_ins_code",
+    "pdbx_seq_align_end_ins_code",
+)
+# Starting columns of the 13 residue names on a SEQRES line
+_SEQRES_STARTS = range(19, 68, 4)
 
 
 class DatabaseReference(BaseRecord):
@@ -66,6 +85,22 @@ class DatabaseReference(BaseRecord):
     +---------+-------------+--------------------+-----------------------------+
     """
 
+    __slots__ = (
+        "id_code",
+        "chain_id",
+        "seq_begin",
+        "ins_begin",
+        "seq_end",
+        "ins_end",
+        "database",
+        "database_accession",
+        "database_id_code",
+        "database_seq_begin",
+        "database_ins_begin",
+        "database_seq_end",
+        "database_ins_end",
+    )
+
     def __init__(self):
         super().__init__()
         self.id_code = ""
@@ -93,32 +128,31 @@ class DatabaseReference(BaseRecord):
         db_refs = []
         struct_ref_seq_df = cif_df(container.get_object("struct_ref_seq"))
         struct_ref_df = cif_df(container.get_object("struct_ref"))
-        df = struct_ref_df.merge(
-            struct_ref_seq_df,
+        df = struct_ref_df.join(
+            struct_ref_seq_df.set_index("align_id"),
+            on="id",
             how="left",
-            left_on="id",
-            right_on="align_id",
-            suffixes=("", "_seq"),
+            rsuffix="_seq",
+            sort=False,
         )
-        for _, row in df.iterrows():
-            row = row.dropna()
-            id_code = row["pdbx_PDB_id_code"]
-            chain_id = row["pdbx_strand_id"]
-            seq_begin = row["seq_align_beg"]
-            try:
-                ins_begin = row["pdbx_seq_align_beg_ins_code"]
-            except KeyError:
-                ins_begin = ""
-            seq_end = row["seq_align_end"]
-            try:
-                ins_end = row["pdbx_seq_align_end_ins_code"]
-            except KeyError:
-                ins_end = ""
-            database = row["db_name"]
-            database_accession = row["pdbx_db_accession"]
-            database_id_code = row["db_code"]
-            database_seq_begin = row["db_align_beg"]
-            database_seq_end = row["db_align_end"]
+        # Only the insertion codes may be absent; selecting the columns
+        # raises KeyError if any other column is missing
+        missing = [col for col in _DBREF_OPTIONAL_COLUMNS if col not in df]
+        df = df.assign(**dict.fromkeys(missing, ""))
+        df = df[_DBREF_CIF_COLUMNS].fillna("")
+        for (
+            id_code,
+            chain_id,
+            seq_begin,
+            ins_begin,
+            seq_end,
+            ins_end,
+            database,
+            database_accession,
+            database_id_code,
+            database_seq_begin,
+            database_seq_end,
+        ) in df.itertuples(index=False, name=None):
             if len(database_accession) < 13:
                 ref = DatabaseReference()
                 ref.id_code = id_code
@@ -158,7 +192,7 @@ class DatabaseReference(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[7:11].strip()
         self.chain_id = line[12].strip()
         self.seq_begin = int(line[14:18])
@@ -174,13 +208,14 @@ class DatabaseReference(BaseRecord):
         self.database_ins_end = line[67].strip()
 
     def __str__(self):
-        str = f"DBREF  {self.id_code:4} {self.chain_id:1} {self.seq_begin:>4}"
-        str += f"{self.ins_begin:1} {self.seq_end:>4}{self.ins_end:1} "
-        str += f"{self.database:6} {self.database_accession:8} "
-        str += f"{self.database_id_code:12} {self.database_seq_begin:>5}"
-        str += f"{self.database_ins_begin:1} {self.database_seq_end:>5}"
-        str += f"{self.database_ins_end:1}"
-        return str
+        return (
+            f"DBREF  {self.id_code:4} {self.chain_id:1} {self.seq_begin:>4}"
+            f"{self.ins_begin:1} {self.seq_end:>4}{self.ins_end:1} "
+            f"{self.database:6} {self.database_accession:8} "
+            f"{self.database_id_code:12} {self.database_seq_begin:>5}"
+            f"{self.database_ins_begin:1} {self.database_seq_end:>5}"
+            f"{self.database_ins_end:1}"
+        )
 
 
 class DatabaseReference1(BaseRecord):
@@ -222,6 +257,17 @@ class DatabaseReference1(BaseRecord):
     +---------+-------------+-------------+-----------------------------------+
     """
 
+    __slots__ = (
+        "id_code",
+        "chain_id",
+        "seq_begin",
+        "ins_begin",
+        "seq_end",
+        "ins_end",
+        "database",
+        "database_id_code",
+    )
+
     def __init__(self):
         super().__init__()
         self.id_code = None
@@ -238,7 +284,7 @@ class DatabaseReference1(BaseRecord):
 
         :param str line:  line with PDB class
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[7:11].strip()
         self.chain_id = line[12].strip()
         self.seq_begin = int(line[14:18])
@@ -287,6 +333,14 @@ class DatabaseReference2(BaseRecord):
     +---------+-------------+--------------+----------------------------------+
     """
 
+    __slots__ = (
+        "id_code",
+        "chain_id",
+        "database_accession",
+        "database_seq_begin",
+        "database_seq_end",
+    )
+
     def __init__(self):
         super().__init__()
         self.id_code = None
@@ -300,18 +354,18 @@ class DatabaseReference2(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[7:11].strip()
         self.chain_id = line[12].strip()
         self.database_accession = line[18:40].strip()
         self.database_seq_begin = int(line[45:55])
-        self.seq_end = int(line[57:67])
+        self.database_seq_end = int(line[57:67])
 
     def __str__(self):
         return (
             f"DBREF2 {self.id_code:4} {self.chain_id:1}"
             f"     {self.database_accession:22}     {self.database_seq_begin:10}"
-            f"  {self.seq_end:10}"
+            f"  {self.database_seq_end:10}"
         )
 
 
@@ -345,6 +399,16 @@ class ModifiedResidue(BaseRecord):
     +---------+--------------+--------------+---------------------------------+
     """
 
+    __slots__ = (
+        "id_code",
+        "residue_name",
+        "chain_id",
+        "sequence_num",
+        "ins_code",
+        "standard_res",
+        "comment",
+    )
+
     def __init__(self):
         super().__init__()
         self.id_code = None
@@ -374,11 +438,11 @@ class ModifiedResidue(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[7:11].strip()
         self.residue_name = line[12:15].strip()
         self.chain_id = line[16].strip()
-        self.sequence_num = int(line[18:22].strip())
+        self.sequence_num = int(line[18:22])
         self.ins_code = line[22].strip()
         self.standard_res = line[24:27].strip()
         self.comment = line[29:70].strip()
@@ -432,6 +496,19 @@ class SequenceDifferences(BaseRecord):
     +---------+--------------+-------------+----------------------------------+
     """
 
+    __slots__ = (
+        "id_code",
+        "res_name",
+        "chain_id",
+        "seq_num",
+        "ins_code",
+        "database",
+        "db_id_code",
+        "db_res",
+        "db_seq",
+        "conflict",
+    )
+
     def __init__(self):
         super().__init__()
         self.id_code = None
@@ -457,8 +534,6 @@ class SequenceDifferences(BaseRecord):
         cif_obj = container.get_object("struct_ref_seq_dif")
         if cif_obj is None:
             return diffs
-        df = cif_df(cif_obj)
-        print(df)
         raise NotImplementedError()
 
     def parse_pdb(self, line):
@@ -466,22 +541,21 @@ class SequenceDifferences(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         self.id_code = line[7:11].strip()
         self.res_name = line[12:15].strip()
         self.chain_id = line[16].strip()
-        try:
-            self.seq_num = int(line[18:22].strip())
-        except ValueError:
-            pass
+        # Sequence numbers may be blank
+        seq_num = line[18:22]
+        if seq_num.strip():
+            self.seq_num = int(seq_num)
         self.ins_code = line[22].strip()
         self.database = line[24:28].strip()
         self.db_id_code = line[29:38].strip()
         self.db_res = line[39:42].strip()
-        try:
-            self.db_seq = int(line[43:48].strip())
-        except ValueError:
-            pass
+        db_seq = line[43:48]
+        if db_seq.strip():
+            self.db_seq = int(db_seq)
         self.conflict = line[49:70].strip()
 
     def __str__(self):
@@ -546,9 +620,11 @@ class SequenceResidues(BaseRecord):
     +---------+--------------+----------+-------------------------------------+
     """
 
+    __slots__ = ("_residues", "num_residues")
+
     def __init__(self):
         super().__init__()
-        self._residues = OrderedDict()
+        self._residues = {}
         self.num_residues = {}
 
     @property
@@ -567,15 +643,28 @@ class SequenceResidues(BaseRecord):
             parse
         :returns:  True if useful information was extracted from container
         """
-        value_added = False
+        import numpy as np
+
         pdbx_poly_seq_df = cif_df(
             container.get_object("pdbx_poly_seq_scheme")
         )
-        groups = pdbx_poly_seq_df.groupby("pdb_strand_id")
-        for strand_id, df in groups:
-            if len(df["mon_id"].values) > 0:
-                value_added = True
-                self._residues[strand_id] = df["mon_id"].values
+        # Skip rows without a strand ID, which cannot be sorted with strings
+        pdbx_poly_seq_df = pdbx_poly_seq_df[
+            pdbx_poly_seq_df["pdb_strand_id"].notna()
+        ]
+        strand_ids = pdbx_poly_seq_df["pdb_strand_id"].to_numpy()
+        mon_ids = pdbx_poly_seq_df["mon_id"].to_numpy()
+        # Group residue names by strand with a stable sort so that each
+        # strand keeps its sequence order
+        order = np.argsort(strand_ids, kind="stable")
+        strand_ids = strand_ids[order]
+        mon_ids = mon_ids[order]
+        unique_ids, first = np.unique(strand_ids, return_index=True)
+        value_added = len(unique_ids) > 0
+        for strand_id, residues in zip(
+            unique_ids.tolist(), np.split(mon_ids, first[1:])
+        ):
+            self._residues[strand_id] = residues
         entity_poly_seq_df = cif_df(
             container.get_object("entity_poly_seq_df")
         )
@@ -596,19 +685,14 @@ class SequenceResidues(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
+        BaseRecord.parse_pdb(self, line)
         chain_id = line[11].strip()
-        if chain_id not in self._residues:
-            self._residues[chain_id] = []
         self.num_residues[chain_id] = int(line[13:17])
-        start = 19
-        end = 22
-        while True:
-            self._residues[chain_id].append(line[start:end].strip())
-            start += 4
-            end += 4
-            if start > 68:
-                break
+        # Residue names repeat heavily; interning shares one object per name
+        names = (line[start:start + 3].strip() for start in _SEQRES_STARTS)
+        self._residues.setdefault(chain_id, []).extend(
+            [intern(name) for name in names if name]
+        )
 
     def num_chains(self) -> int:
         """Number of chains in sequence."""
@@ -617,12 +701,14 @@ class SequenceResidues(BaseRecord):
     def __str__(self):
         strings = []
         for chain_id, residues in self._residues.items():
-            for ichunk, chunk in enumerate(grouper(residues, 13)):
-                serial_num = ichunk + 1
-                string = f"SEQRES {serial_num:>3} {chain_id:1} "
-                string += f"{self.num_residues[chain_id]:>4} "
-                for residue in chunk:
-                    if residue is not None:
-                        string += f" {residue:>3}"
-                strings.append(string.strip())
+            num_residues = self.num_residues[chain_id]
+            strings += [
+                (
+                    f"SEQRES {serial_num:>3} {chain_id:1} {num_residues:>4} "
+                    + "".join(f" {residue:>3}" for residue in chunk)
+                ).strip()
+                for serial_num, chunk in enumerate(
+                    grouper(residues, 13), start=1
+                )
+            ]
         return "\n".join(strings)
@@ -5,12 +5,26 @@
 .. codeauthor::  Nathan Baker
 """
 import logging
-from .general import BaseRecord, atom_format, cif_df
+from sys import intern
+from .general import BaseRecord, atom_format, cif_df, cif_rows
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def struct_conn_table(container):
+    """Get the ``struct_conn`` table with missing values blanked.
+
+    :class:`DisulfideBond` and :class:`Link` both read this table; callers
+    parsing both can build it once and pass it to their ``parse_cif``.
+
+    :param :class:`pdbx.containers.DataContainer` container:  container to
+        parse
+    :returns:  DataFrame with the ``struct_conn`` rows
+    """
+    return cif_df(container.get_object("struct_conn")).fillna("")
+
+
 class CisPeptide(BaseRecord):
     """CISPEP field
 
@@ -47,6 +61,20 @@ class CisPeptide(BaseRecord):
     +---------+-------------+-----------+-------------------------------------+
     """
 
+    __slots__ = (
+        "ser_num",
+        "pep1",
+        "chain_id1",
+        "seq_num1",
+        "icode1",
+        "pep2",
+        "chain_id2",
+        "seq_num2",
+        "icode2",
+        "mod_num",
+        "measure",
+    )
+
     def __init__(self):
         super().__init__()
         self.ser_num = None
@@ -70,20 +98,47 @@ class CisPeptide(BaseRecord):
         :returns:  list of objects of this class
         """
         cis_peps = []
-        df = cif_df(container.get_object("struct_mon_prot_cis")).fillna("")
-        for _, row in df.iterrows():
+        rows = cif_rows(
+            container.get_object("struct_mon_prot_cis"),
+            [
+                "pdbx_id",
+                "auth_comp_id",
+                "auth_asym_id",
+                "auth_seq_id",
+                "pdbx_PDB_ins_code",
+                "pdbx_auth_comp_id_2",
+                "pdbx_auth_asym_id_2",
+                "pdbx_auth_seq_id_2",
+                "pdbx_PDB_ins_code_2",
+                "pdbx_PDB_model_num",
+                "pdbx_omega_angle",
+            ],
+        )
+        for (
+            ser_num,
+            pep1,
+            chain_id1,
+            seq_num1,
+            icode1,
+            pep2,
+            chain_id2,
+            seq_num2,
+            icode2,
+            mod_num,
+            measure,
+        ) in rows:
             pep = CisPeptide()
-            pep.ser_num = int(row["pdbx_id"])
-            pep.pep1 = row["auth_comp_id"]
-            pep.chain_id1 = row["auth_asym_id"]
-            pep.seq_num1 = int(row["auth_seq_id"])
-            pep.icode1 = row["pdbx_PDB_ins_code"]
-            pep.pep2 = row["pdbx_auth_comp_id_2"]
-            pep.chain_id2 = row["pdbx_auth_asym_id_2"]
-            pep.seq_num2 = int(row["pdbx_auth_seq_id_2"])
-            pep.icode2 = row["pdbx_PDB_ins_code_2"]
-            pep.mod_num = int(row["pdbx_PDB_model_num"])
-            pep.measure = float(row["pdbx_omega_angle"])
+            pep.ser_num = int(ser_num)
+            pep.pep1 = intern(pep1)
+            pep.chain_id1 = chain_id1
+            pep.seq_num1 = int(seq_num1)
+            pep.icode1 = icode1
+            pep.pep2 = intern(pep2)
+            pep.chain_id2 = chain_id2
+            pep.seq_num2 = int(seq_num2)
+            pep.icode2 = icode2
+            pep.mod_num = int(mod_num)
+            pep.measure = float(measure)
             cis_peps.append(pep)
         return cis_peps
 
@@ -92,25 +147,26 @@ class CisPeptide(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.ser_num = int(line[7:10].strip())
-        self.pep1 = line[11:14].strip()
+        BaseRecord.parse_pdb(self, line)
+        self.ser_num = int(line[7:10])
+        self.pep1 = intern(line[11:14].strip())
         self.chain_id1 = line[15].strip()
-        self.seq_num1 = int(line[17:21].strip())
+        self.seq_num1 = int(line[17:21])
         self.icode1 = line[21].strip()
-        self.pep2 = line[25:28].strip()
+        self.pep2 = intern(line[25:28].strip())
         self.chain_id2 = line[29].strip()
-        self.seq_num2 = int(line[31:35].strip())
+        self.seq_num2 = int(line[31:35])
         self.icode2 = line[35].strip()
-        self.mod_num = int(line[43:46].strip())
-        self.measure = float(line[53:59].strip())
+        self.mod_num = int(line[43:46])
+        self.measure = float(line[53:59])
 
     def __str__(self):
-        str_ = f"CISPEP {self.ser_num:3} {self.pep1:3} {self.chain_id1:1}"
-        str_ += f" {self.seq_num1:4}{self.icode1:1}   {self.pep2:3}"
-        str_ += f" {self.chain_id2:1} {self.seq_num2:4}{self.icode2:1}"
-        str_ += f"       {self.mod_num:3}       {self.measure:6.2f}"
-        return str_
+        return (
+            f"CISPEP {self.ser_num:3} {self.pep1:3} {self.chain_id1:1}"
+            f" {self.seq_num1:4}{self.icode1:1}   {self.pep2:3}"
+            f" {self.chain_id2:1} {self.seq_num2:4}{self.icode2:1}"
+            f"       {self.mod_num:3}       {self.measure:6.2f}"
+        )
 
 
 class DisulfideBond(BaseRecord):
@@ -151,6 +207,19 @@ class DisulfideBond(BaseRecord):
     +---------+-------------+-----------+-------------------------------------+
     """
 
+    __slots__ = (
+        "ser_num",
+        "chain_id1",
+        "seq_num1",
+        "icode1",
+        "chain_id2",
+        "seq_num2",
+        "icode2",
+        "sym1",
+        "sym2",
+        "length",
+    )
+
     def __init__(self):
         super().__init__()
         self.ser_num = None
@@ -165,27 +234,55 @@ class DisulfideBond(BaseRecord):
         self.length = None
 
     @staticmethod
-    def parse_cif(container) -> list:
+    def parse_cif(container, struct_conn=None) -> list:
         """Parse CIF container for information about this record.
 
         :param :class:`pdbx.containers.DataContainer` container:  container to
             parse
+        :param pandas.DataFrame struct_conn:  table from
+            :func:`struct_conn_table`; built from the container if not given
         :returns:  list of objects of this class
         """
         bonds = []
-        df = cif_df(container.get_object("struct_conn")).fillna("")
-        for id_, row in df.iterrows():
+        df = struct_conn
+        if df is None:
+            df = struct_conn_table(container)
+        if df.empty:
+            return bonds
+        cols = df[
+            [
+                "ptnr1_auth_asym_id",
+                "ptnr1_auth_seq_id",
+                "pdbx_ptnr1_PDB_ins_code",
+                "ptnr2_auth_asym_id",
+                "ptnr2_auth_seq_id",
+                "pdbx_ptnr2_PDB_ins_code",
+                "ptnr1_symmetry",
+                "ptnr2_symmetry",
+                "pdbx_dist_value",
+            ]
+        ]
+        for ser_num, (
+            chain_id1,
+            seq_num1,
+            icode1,
+            chain_id2,
+            seq_num2,
+            icode2,
+            sym1,
+            sym2,
+            distance,
+        ) in enumerate(cols.itertuples(index=False, name=None), start=1):
             bond = DisulfideBond()
-            bond.ser_num = id_ + 1
-            bond.chain_id1 = row["ptnr1_auth_asym_id"]
-            bond.seq_num1 = row["ptnr1_auth_seq_id"]
-            bond.icode1 = row["pdbx_ptnr1_PDB_ins_code"]
-            bond.chain_id2 = row["ptnr2_auth_asym_id"]
-            bond.seq_num2 = row["ptnr2_auth_seq_id"]
-            bond.icode2 = row["pdbx_ptnr2_PDB_ins_code"]
-            bond.sym1 = row["ptnr1_symmetry"]
-            bond.sym2 = row["ptnr2_symmetry"]
-            distance = row["pdbx_dist_value"]
+            bond.ser_num = ser_num
+            bond.chain_id1 = chain_id1
+            bond.seq_num1 = seq_num1
+            bond.icode1 = icode1
+            bond.chain_id2 = chain_id2
+            bond.seq_num2 = seq_num2
+            bond.icode2 = icode2
+            bond.sym1 = sym1
+            bond.sym2 = sym2
             if distance:
                 bond.length = float(distance)
             bonds.append(bond)
@@ -196,28 +293,26 @@ class DisulfideBond(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.ser_num = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.ser_num = int(line[7:10])
         self.chain_id1 = line[15].strip()
-        self.seq_num1 = int(line[17:21].strip())
+        self.seq_num1 = int(line[17:21])
         self.icode1 = line[21].strip()
         self.chain_id2 = line[29].strip()
-        self.seq_num2 = int(line[31:35].strip())
+        self.seq_num2 = int(line[31:35])
         self.icode2 = line[35].strip()
         self.sym1 = line[59:65].strip()
         self.sym2 = line[66:72].strip()
         self.length = float(line[73:78])
 
     def __str__(self):
-        str_ = (
+        length = f"{self.length:4.2f}" if self.length else ""
+        return (
             f"SSBOND {self.ser_num:3} CYS {self.chain_id1:1} {self.seq_num1:4}"
             f"{self.icode1:1}   CYS {self.chain_id2:1} {self.seq_num2:4}"
             f"{self.icode2:1}                         {self.sym1:6}"
-            f" {self.sym2:6}"
+            f" {self.sym2:6}{length}"
         )
-        if self.length:
-            str_ += f"{self.length:4.2f}"
-        return str_
 
 
 class Helix(BaseRecord):
@@ -272,6 +367,22 @@ class Helix(BaseRecord):
     +---------+--------------+---------------+--------------------------------+
     """
 
+    __slots__ = (
+        "ser_num",
+        "helix_id",
+        "init_res_name",
+        "init_chain_id",
+        "init_seq_num",
+        "init_i_code",
+        "end_res_name",
+        "end_chain_id",
+        "end_seq_num",
+        "end_i_code",
+        "helix_class",
+        "comment",
+        "length",
+    )
+
     def __init__(self):
         super().__init__()
         self.ser_num = None
@@ -297,23 +408,51 @@ class Helix(BaseRecord):
         :returns:  list of objects of this class
         """
         helices = []
-        df = cif_df(container.get_object("struct_conf"))
-        df = df.fillna("")
-        for _, row in df.iterrows():
+        rows = cif_rows(
+            container.get_object("struct_conf"),
+            [
+                "pdbx_PDB_helix_id",
+                "beg_auth_comp_id",
+                "beg_auth_asym_id",
+                "beg_auth_seq_id",
+                "pdbx_beg_PDB_ins_code",
+                "end_auth_comp_id",
+                "end_auth_asym_id",
+                "end_auth_seq_id",
+                "pdbx_end_PDB_ins_code",
+                "pdbx_PDB_helix_class",
+                "details",
+                "pdbx_PDB_helix_length",
+            ],
+        )
+        for (
+            helix_id,
+            init_res_name,
+            init_chain_id,
+            init_seq_num,
+            init_i_code,
+            end_res_name,
+            end_chain_id,
+            end_seq_num,
+            end_i_code,
+            helix_class,
+            comment,
+            length,
+        ) in rows:
             helix = Helix()
-            helix.ser_num = row["pdbx_PDB_helix_id"]
-            helix.helix_id = row["pdbx_PDB_helix_id"]
-            helix.init_res_name = row["beg_auth_comp_id"]
-            helix.init_chain_id = row["beg_auth_asym_id"]
-            helix.init_seq_num = row["beg_auth_seq_id"]
-            helix.init_i_code = row["pdbx_beg_PDB_ins_code"]
-            helix.end_res_name = row["end_auth_comp_id"]
-            helix.end_chain_id = row["end_auth_asym_id"]
-            helix.end_seq_num = row["end_auth_seq_id"]
-            helix.end_i_code = row["pdbx_end_PDB_ins_code"]
-            helix.helix_class = row["pdbx_PDB_helix_class"]
-            helix.comment = row["details"]
-            helix.length = row["pdbx_PDB_helix_length"]
+            helix.ser_num = helix_id
+            helix.helix_id = helix_id
+            helix.init_res_name = intern(init_res_name)
+            helix.init_chain_id = init_chain_id
+            helix.init_seq_num = init_seq_num
+            helix.init_i_code = init_i_code
+            helix.end_res_name = intern(end_res_name)
+            helix.end_chain_id = end_chain_id
+            helix.end_seq_num = end_seq_num
+            helix.end_i_code = end_i_code
+            helix.helix_class = helix_class
+            helix.comment = comment
+            helix.length = length
             helices.append(helix)
         return helices
 
@@ -322,26 +461,25 @@ class Helix(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.ser_num = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.ser_num = int(line[7:10])
         self.helix_id = line[11:14].strip()
-        self.init_res_name = line[15:18].strip()
+        self.init_res_name = intern(line[15:18].strip())
         self.init_chain_id = line[19].strip()
-        self.init_seq_num = int(line[21:25].strip())
+        self.init_seq_num = int(line[21:25])
         self.init_i_code = line[25].strip()
-        self.end_res_name = line[27:30].strip()
+        self.end_res_name = intern(line[27:30].strip())
         self.end_chain_id = line[31].strip()
-        self.end_seq_num = int(line[33:37].strip())
+        self.end_seq_num = int(line[33:37])
         self.end_i_code = line[37].strip()
-        try:
-            self.helix_class = int(line[38:40].strip())
-        except ValueError:
-            pass
+        # Helix class and length are optional
+        helix_class = line[38:40]
+        if helix_class.strip():
+            self.helix_class = int(helix_class)
         self.comment = line[40:70].strip()
-        try:
-            self.length = int(line[71:76].strip())
-        except ValueError:
-            pass
+        length = line[71:76]
+        if length.strip():
+            self.length = int(length)
 
     def __str__(self):
         return (
@@ -354,6 +492,20 @@ class Helix(BaseRecord):
         )
 
 
+def _link_atom_name(name, is_element) -> str:
+    """Format an atom name for the 4-character LINK atom-name field.
+
+    :param str name:  atom name
+    :param bool is_element:  whether the name starts with the element symbol
+    :returns:  formatted atom name
+    """
+    if is_element:
+        return f"{name:>2}  "[:4]
+    if len(name) == 2:
+        return f" {name} "
+    return f"{name:>4}"
+
+
 class Link(BaseRecord):
     """LINK field
 
@@ -401,6 +553,26 @@ class Link(BaseRecord):
     +---------+--------------+-----------+------------------------------------+
     """
 
+    __slots__ = (
+        "name1",
+        "alt_loc1",
+        "res_name1",
+        "chain_id1",
+        "res_seq1",
+        "ins_code1",
+        "name2",
+        "alt_loc2",
+        "res_name2",
+        "chain_id2",
+        "res_seq2",
+        "ins_code2",
+        "sym1",
+        "sym2",
+        "length",
+        "is_element1",
+        "is_element2",
+    )
+
     def __init__(self):
         super().__init__()
         self.name1 = None
@@ -420,36 +592,77 @@ class Link(BaseRecord):
         self.length = None
 
     @staticmethod
-    def parse_cif(container) -> list:
+    def parse_cif(container, struct_conn=None) -> list:
         """Parse CIF container for information about this record.
 
         :param :class:`pdbx.containers.DataContainer` container:  container to
             parse
+        :param pandas.DataFrame struct_conn:  table from
+            :func:`struct_conn_table`; built from the container if not given
         :returns:  list of objects of this class
         """
         links = []
-        df = cif_df(container.get_object("struct_conn")).fillna("")
-        for _, row in df.iterrows():
+        df = struct_conn
+        if df is None:
+            df = struct_conn_table(container)
+        if df.empty:
+            return links
+        # Disulfide bonds are reported as SSBOND records instead
+        df = df.loc[df["conn_type_id"].to_numpy() != "disulf"]
+        cols = df[
+            [
+                "ptnr1_label_atom_id",
+                "pdbx_ptnr1_label_alt_id",
+                "ptnr1_auth_comp_id",
+                "ptnr1_auth_asym_id",
+                "ptnr1_auth_seq_id",
+                "pdbx_ptnr1_PDB_ins_code",
+                "ptnr2_label_atom_id",
+                "pdbx_ptnr2_label_alt_id",
+                "ptnr2_auth_comp_id",
+                "ptnr2_auth_asym_id",
+                "ptnr2_auth_seq_id",
+                "pdbx_ptnr2_PDB_ins_code",
+                "ptnr1_symmetry",
+                "ptnr2_symmetry",
+                "pdbx_dist_value",
+            ]
+        ]
+        for (
+            name1,
+            alt_loc1,
+            res_name1,
+            chain_id1,
+            res_seq1,
+            ins_code1,
+            name2,
+            alt_loc2,
+            res_name2,
+            chain_id2,
+            res_seq2,
+            ins_code2,
+            sym1,
+            sym2,
+            distance,
+        ) in cols.itertuples(index=False, name=None):
             link = Link()
-            if row["conn_type_id"] not in ["disulf"]:
-                link.name1 = row["ptnr1_label_atom_id"]
-                link.alt_loc1 = row["pdbx_ptnr1_label_alt_id"]
-                link.res_name1 = row["ptnr1_auth_comp_id"]
-                link.chain_id1 = row["ptnr1_auth_asym_id"]
-                link.res_seq1 = row["ptnr1_auth_seq_id"]
-                link.ins_code1 = row["pdbx_ptnr1_PDB_ins_code"]
-                link.name2 = row["ptnr2_label_atom_id"]
-                link.alt_loc2 = row["pdbx_ptnr2_label_alt_id"]
-                link.res_name2 = row["ptnr2_auth_comp_id"]
-                link.chain_id2 = row["ptnr2_auth_asym_id"]
-                link.res_seq2 = row["ptnr2_auth_seq_id"]
-                link.ins_code2 = row["pdbx_ptnr2_PDB_ins_code"]
-                link.sym1 = row["ptnr1_symmetry"]
-                link.sym2 = row["ptnr2_symmetry"]
-                distance = row["pdbx_dist_value"]
-                if distance:
-                    link.length = float(distance)
-                links.append(link)
+            link.name1 = intern(name1)
+            link.alt_loc1 = alt_loc1
+            link.res_name1 = intern(res_name1)
+            link.chain_id1 = chain_id1
+            link.res_seq1 = res_seq1
+            link.ins_code1 = ins_code1
+            link.name2 = intern(name2)
+            link.alt_loc2 = alt_loc2
+            link.res_name2 = intern(res_name2)
+            link.chain_id2 = chain_id2
+            link.res_seq2 = res_seq2
+            link.ins_code2 = ins_code2
+            link.sym1 = sym1
+            link.sym2 = sym2
+            if distance:
+                link.length = float(distance)
+            links.append(link)
         return links
 
     def parse_pdb(self, line):
@@ -457,18 +670,18 @@ class Link(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.name1 = line[12:16].strip()
+        BaseRecord.parse_pdb(self, line)
+        self.name1 = intern(line[12:16].strip())
         self.alt_loc1 = line[16].strip()
-        self.res_name1 = line[17:20].strip()
+        self.res_name1 = intern(line[17:20].strip())
         self.chain_id1 = line[21].strip()
-        self.res_seq1 = int(line[22:26].strip())
+        self.res_seq1 = int(line[22:26])
         self.ins_code1 = line[26].strip()
-        self.name2 = line[42:46].strip()
+        self.name2 = intern(line[42:46].strip())
         self.alt_loc2 = line[46].strip()
-        self.res_name2 = line[47:50].strip()
+        self.res_name2 = intern(line[47:50].strip())
         self.chain_id2 = line[51].strip()
-        self.res_seq2 = int(line[52:56].strip())
+        self.res_seq2 = int(line[52:56])
         self.ins_code2 = line[56].strip()
         self.sym1 = line[59:65].strip()
         self.sym2 = line[66:72].strip()
@@ -479,37 +692,23 @@ class Link(BaseRecord):
     def __str__(self):
         # See atom-name formatting rules at
         # https://www.cgl.ucsf.edu/chimera/docs/UsersGuide/tutorials/pdbintro.html
-        if None in [self.is_element1, self.is_element2]:
+        if self.is_element1 is None or self.is_element2 is None:
             err = (
                 "Must run annotate_link first before correctly formatted "
                 "strings can be produced."
             )
             raise ValueError(err)
-        if self.is_element1:
-            name1 = f"{self.name1:>2}  "[:4]
-        elif len(self.name1) == 2:
-            name1 = f" {self.name1} "
-        else:
-            name1 = f"{self.name1:>4}"
-        if self.is_element2:
-            name2 = f"{self.name2:>2}  "[:4]
-        elif len(self.name2) == 2:
-            name2 = f" {self.name2} "
-        else:
-            name2 = f"{self.name2:>4}"
-        string = f"LINK        "
-        string += (
+        name1 = _link_atom_name(self.name1, self.is_element1)
+        name2 = _link_atom_name(self.name2, self.is_element2)
+        length = f" {self.length:5}" if self.length else ""
+        return (
+            f"LINK        "
             f"{name1}{self.alt_loc1:1}{self.res_name1:>3} {self.chain_id1:1}"
             f"{self.res_seq1:4}{self.ins_code1:1}               "
-        )
-        string += (
             f"{name2}{self.alt_loc2:1}{self.res_name2:>3} {self.chain_id2}"
             f"{self.res_seq2:4}{self.ins_code2:1}  {self.sym1:>6} "
-            f"{self.sym2:>6}"
+            f"{self.sym2:>6}{length}"
         )
-        if self.length:
-            string += f" {self.length:5}"
-        return string
 
 
 class Sheet(BaseRecord):
@@ -592,6 +791,31 @@ class Sheet(BaseRecord):
     +---------+--------------+---------------+--------------------------------+
     """
 
+    __slots__ = (
+        "range_id",
+        "sheet_id",
+        "num_strands",
+        "init_res_name",
+        "init_chain_id",
+        "init_seq_num",
+        "init_ins_code",
+        "end_res_name",
+        "end_chain_id",
+        "end_seq_num",
+        "end_ins_code",
+        "sense",
+        "curr_atom",
+        "curr_res_name",
+        "curr_chain_id",
+        "curr_res_seq",
+        "curr_ins_code",
+        "prev_atom",
+        "prev_res_name",
+        "prev_chain_id",
+        "prev_res_seq",
+        "prev_ins_code",
+    )
+
     def __init__(self):
         super().__init__()
         self.range_id = None
@@ -738,35 +962,35 @@ class Sheet(BaseRecord):
 
         :param str line:  line to parse
         """
-        super().parse_pdb(line)
-        self.range_id = int(line[7:10].strip())
+        BaseRecord.parse_pdb(self, line)
+        self.range_id = int(line[7:10])
         self.sheet_id = line[11:14].strip()
-        self.num_strands = int(line[14:16].strip())
-        self.init_res_name = line[17:20].strip()
+        self.num_strands = int(line[14:16])
+        self.init_res_name = intern(line[17:20].strip())
         self.init_chain_id = line[21].strip()
-        self.init_seq_num = int(line[22:26].strip())
+        self.init_seq_num = int(line[22:26])
         self.init_ins_code = line[26].strip()
-        self.end_res_name = line[28:31].strip()
+        self.end_res_name = intern(line[28:31].strip())
         self.end_chain_id = line[32].strip()
-        self.end_seq_num = int(line[33:37].strip())
+        self.end_seq_num = int(line[33:37])
         self.end_ins_code = line[37].strip()
-        self.sense = int(line[38:40].strip())
-        self.curr_atom = line[41:45].strip()
-        self.curr_res_name = line[45:48].strip()
+        self.sense = int(line[38:40])
+        self.curr_atom = intern(line[41:45].strip())
+        self.curr_res_name = intern(line[45:48].strip())
         try:
             self.curr_chain_id = line[49].strip()
-            try:
-                self.curr_res_seq = int(line[50:54].strip())
-            except ValueError:
-                self.curr_res_seq = ""
+            curr_res_seq = line[50:54]
+            self.curr_res_seq = (
+                int(curr_res_seq) if curr_res_seq.strip() else ""
+            )
             self.curr_ins_code = line[54].strip()
-            self.prev_atom = line[56:60].strip()
-            self.prev_res_name = line[60:63].strip()
+            self.prev_atom = intern(line[56:60].strip())
+            self.prev_res_name = intern(line[60:63].strip())
             self.prev_chain_id = line[64].strip()
-            try:
-                self.prev_res_seq = int(line[65:69].strip())
-            except ValueError:
-                self.prev_res_seq = ""
+            prev_res_seq = line[65:69]
+            self.prev_res_seq = (
+                int(prev_res_seq) if prev_res_seq.strip() else ""
+            )
             self.prev_ins_code = line[69].strip()
         except IndexError:
             pass
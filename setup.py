@@ -20,7 +20,7 @@ setuptools.setup(
     url="https://github.com/Electrostatics/pdb2cif",
     packages=setuptools.find_packages(),
     package_data={"": ["tests/data/*"]},
-    install_requires=["requests", "pandas", "mmcif_pdbx"],
+    install_requires=["requests", "numpy", "pandas", "mmcif_pdbx"],
     extras_require={
         "dev": ["check-manifest"],
         "test": [